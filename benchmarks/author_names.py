@@ -0,0 +1,108 @@
+import random
+import sys
+import time
+
+from src.names import PARSE_CACHE_SIZE, compose_author_name, parse_author_name
+
+GIVEN_NAMES = ["Ana", "Maria", "José", "João", "Pedro", "Carlos", "Lucia", "Gabriel", "Beatriz", "Rafael", "J.", "R."]
+PARTICLES = ["", "", "da", "de", "dos", "do"]
+SURNAMES = ["Silva", "Souza", "Oliveira", "Santos", "Pereira", "Ferreira", "Alves", "Lima", "Castelo Branco", "Ortega y Gasset"]
+SUFFIXES = ["", "", "", "Júnior", "Filho", "Neto"]
+
+# (author string, expected ABNT entry)
+EXAMPLES = [
+    ("José de Assis Júnior", "ASSIS JÚNIOR, José de"),
+    ("João da Silva Filho", "SILVA FILHO, João da"),
+    ("Maria da Silva", "SILVA, Maria da"),
+    ("Pedro Victor Da Silva", "SILVA, Pedro Victor Da"),
+    ("La Toya Jackson", "JACKSON, La Toya"),
+    ("José Ortega y Gasset", "ORTEGA Y GASSET, José"),
+    ("Humberto de Alencar Castelo Branco", "CASTELO BRANCO, Humberto de Alencar"),
+    ("Jean de La Fontaine", "LA FONTAINE, Jean de"),
+    ("Ludwig van Beethoven", "BEETHOVEN, Ludwig van"),
+    ("Johannes Diderik van der Waals", "WAALS, Johannes Diderik van der"),
+    ("John von Neumann", "NEUMANN, John von"),
+    ("Silva Júnior", "SILVA JÚNIOR"),
+    ("van der Waals, Johannes Diderik", "WAALS, Johannes Diderik van der"),
+    (", Maria", "MARIA"),
+    (", Maria da Silva", "SILVA, Maria da"),
+    ("J. R. R. Tolkien", "TOLKIEN, J. R. R."),
+    ("Editora", "EDITORA"),
+    ("", ""),
+]
+
+# (crossref family, given, suffix, expected ABNT entry)
+CROSSREF_EXAMPLES = [
+    ("Del Toro", "Guillermo", None, "DEL TORO, Guillermo"),
+    ("La Fontaine", "Jean de", None, "LA FONTAINE, Jean de"),
+    ("Le Goff", "Jacques", None, "LE GOFF, Jacques"),
+    ("Di Giorgio", "Marco", None, "DI GIORGIO, Marco"),
+    ("da Silva", "Maria", None, "SILVA, Maria da"),
+    ("Assis", "José de", "Júnior", "ASSIS JÚNIOR, José de"),
+    ("García Márquez", None, None, "GARCÍA MÁRQUEZ"),
+    ("da Silva", None, None, "DA SILVA"),
+    ("da", "Maria", None, "DA, Maria"),
+    ("van der Waals", "Johannes Diderik", None, "WAALS, Johannes Diderik van der"),
+    ("von Neumann", "John", None, "NEUMANN, John von"),
+    (None, "Maria", None, "MARIA"),
+]
+
+
+def check():
+    for name, expected in EXAMPLES:
+        parsed = parse_author_name(name).abnt()
+        if parsed != expected:
+            raise AssertionError(f"{name!r}: {parsed!r} != {expected!r}")
+
+    for family, given, suffix, expected in CROSSREF_EXAMPLES:
+        parsed = compose_author_name(family, given, suffix).abnt()
+        if parsed != expected:
+            raise AssertionError(f"{(family, given, suffix)!r}: {parsed!r} != {expected!r}")
+
+
+def make_corpus(size: int, unique: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    names = {}
+    while len(names) < unique:
+        parts = [rng.choice(GIVEN_NAMES), rng.choice(GIVEN_NAMES), rng.choice(PARTICLES), rng.choice(SURNAMES), rng.choice(SUFFIXES)]
+        names[" ".join(part for part in parts if part)] = None
+    return rng.choices(list(names), k=size)
+
+
+def run(parse, corpus: list[str]) -> float:
+    start = time.perf_counter()
+    for name in corpus:
+        parse(name)
+    return time.perf_counter() - start
+
+
+def bench(size: int, unique: int):
+    corpus = make_corpus(size, unique)
+
+    uncached = run(parse_author_name.__wrapped__, corpus)
+    parse_author_name.cache_clear()
+    cached = run(parse_author_name, corpus)
+    info = parse_author_name.cache_info()
+
+    print(f"corpus: {size} names ({unique} unique, cache size {PARSE_CACHE_SIZE})")
+    print(f"without memo: {size / uncached:,.0f} names/s")
+    print(f"with memo:    {size / cached:,.0f} names/s ({uncached / cached:.1f}x)")
+    print(f"hit rate:     {info.hits / (info.hits + info.misses):.1%} ({info})")
+
+
+def main():
+    # "python -m benchmarks.author_names check" only runs the parsing rules
+    check()
+    if sys.argv[1:] == ["check"]:
+        print(f"ok: {len(EXAMPLES) + len(CROSSREF_EXAMPLES)} names")
+        return
+
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    # one corpus that fits in the memo and one larger than it
+    uniques = [int(sys.argv[2])] if len(sys.argv) > 2 else [2_000, 4 * PARSE_CACHE_SIZE]
+    for unique in uniques:
+        bench(size, unique)
+
+
+if __name__ == "__main__":
+    main()
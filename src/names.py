@@ -0,0 +1,109 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+# lowercase particles kept with the given names (ABNT NBR 6023:2025 - 8.1.1),
+# e.g. "SILVA, Maria da", "NEUMANN, John von", "WAALS, Johannes Diderik van der"
+PARTICLES = frozenset({"d'", "da", "das", "de", "den", "der", "do", "dos", "ten", "ter", "van", "von", "zu"})
+
+# capitalized romance article prefixes kept in the entry (e.g. "LA FONTAINE, Jean de")
+ARTICLE_PREFIXES = frozenset({"del", "della", "di", "du", "la", "le"})
+
+# kinship suffixes that are part of the entry (e.g. "ASSIS JÚNIOR, José de")
+SUFFIXES = frozenset({
+    "júnior", "junior", "jr", "filho", "filha", "neto", "neta", "sobrinho", "sobrinha",
+})
+
+# conjunctions joining spanish compound surnames (e.g. "ORTEGA Y GASSET, José")
+CONJUNCTIONS = frozenset({"y"})
+
+# compound surnames that can not be told apart from given names by the token alone
+COMPOUND_SURNAMES = frozenset({
+    "castelo branco", "espírito santo", "monte alegre", "vila lobos", "villa lobos",
+})
+
+# a batch export rarely cites more than a few thousand distinct authors, and each
+# entry is a short tuple, so 4096 entries keep the memo well under a megabyte
+PARSE_CACHE_SIZE = 4096
+
+_whitespace_re = re.compile(r"\s+")
+
+
+class AuthorName(NamedTuple):
+    surname: str
+    given: str
+
+    def abnt(self) -> str:
+        if not self.given:
+            return self.surname.upper()
+        return f"{self.surname.upper()}, {self.given}"
+
+
+def _token_key(token: str) -> str:
+    return token.lower().rstrip(".")
+
+
+def _is_particle(token: str) -> bool:
+    return token.islower() and token in PARTICLES
+
+
+def compose_author_name(family: Optional[str], given: Optional[str] = None, suffix: Optional[str] = None) -> AuthorName:
+    """Build an author name from an explicit surname, as given by structured sources (e.g. Crossref)."""
+    family_tokens = (family or "").split()
+    given = " ".join((given or "").split())
+    if not family_tokens:
+        return parse_author_name(given)
+
+    # leading lowercase particles go after the given names (e.g. "da Silva" -> "SILVA, Maria da")
+    particles = []
+    while given and len(family_tokens) > 1 and _is_particle(family_tokens[0]):
+        particles.append(family_tokens.pop(0))
+
+    if suffix:
+        family_tokens.append(suffix.strip())
+    return AuthorName(" ".join(family_tokens), " ".join([given, *particles]).strip())
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_author_name(name: str) -> AuthorName:
+    """Parse a free text author name, either "Given Surname" or inverted as "Surname, Given"."""
+    name = _whitespace_re.sub(" ", name).strip()
+
+    if "," in name:
+        surname, given = (part.strip() for part in name.split(",", 1))
+        if surname:
+            return compose_author_name(surname, given)
+        name = given
+
+    if not name:
+        return AuthorName("", "")
+
+    tokens = name.split(" ")
+    if len(tokens) == 1:
+        return AuthorName(tokens[0], "")
+
+    # kinship suffix goes along with the last surname
+    suffix = []
+    if _token_key(tokens[-1]) in SUFFIXES:
+        suffix.append(tokens.pop())
+
+    surname_tokens = [tokens.pop()]
+
+    # compound surnames joined by a conjunction or listed as known compounds
+    while len(tokens) > 2 and _token_key(tokens[-1]) in CONJUNCTIONS:
+        surname_tokens[0:0] = [tokens.pop(), tokens.pop()][::-1]
+    if len(tokens) > 1 and f"{_token_key(tokens[-1])} {_token_key(surname_tokens[0])}" in COMPOUND_SURNAMES:
+        surname_tokens.insert(0, tokens.pop())
+    if len(tokens) > 1 and tokens[-1][0].isupper() and _token_key(tokens[-1]) in ARTICLE_PREFIXES:
+        surname_tokens.insert(0, tokens.pop())
+
+    # particles (and anything else) before the surname stay with the given names
+    return AuthorName(" ".join(surname_tokens + suffix), " ".join(tokens))
+
+
+def format_authors(main_author: str | AuthorName, other_authors: Optional[list[str | AuthorName]] = None) -> str:
+    authors = [main_author, *(other_authors or [])]
+    return "; ".join(
+        (author if isinstance(author, AuthorName) else parse_author_name(author)).abnt()
+        for author in authors
+    )
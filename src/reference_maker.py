@@ -1,6 +1,7 @@
 from datetime import date
 
 from .schemas import JournalArticle, ProceedingsArticle, Monograph
+from .names import format_authors
 import isbnlib
 
 month_map = {
@@ -22,11 +23,7 @@ month_map = {
 # ABNT NBR 6023:2025 - 7.1.1; 7.2.1; 7.2.2
 def format_monograph(data: Monograph):
     # format author names
-    author_names = data.main_author.split(" ")
-    author_str = f"{author_names.pop().upper()}, {' '.join(author_names)}"
-    for author in data.other_authors:  # type: ignore
-        author_names = author.split(" ")
-        author_str += f"; {author_names.pop().upper()}, {' '.join(author_names)}"
+    author_str = format_authors(data.main_author, data.other_authors)
 
     # basic required reference data
     title_str = f"<strong>{data.title}</strong>: {data.subtitle}" if data.subtitle else f"<strong>{data.title}</strong>"
@@ -54,11 +51,7 @@ def format_monograph(data: Monograph):
 # ABNT NBR 6023:2025 - 7.7.5; 7.7.6
 def format_proceedings_artice(data: ProceedingsArticle):
     # format author names
-    author_names = data.main_author.split(" ")
-    author_str = f"{author_names.pop().upper()}, {' '.join(author_names)}"
-    for author in data.other_authors:  # type: ignore
-        author_names = author.split(" ")
-        author_str += f"; {author_names.pop().upper()}, {' '.join(author_names)}"
+    author_str = format_authors(data.main_author, data.other_authors)
 
     # basic required reference data
     title_str = f"{data.title}: {data.subtitle}" if data.subtitle else data.title
@@ -89,11 +82,7 @@ def format_proceedings_artice(data: ProceedingsArticle):
 # ABNT NBR 6023:2025 - 7.7.7; 7.7.8
 def format_journal_artice(data: JournalArticle):
     # format author names
-    author_names = data.main_author.split(" ")
-    author_str = f"{author_names.pop().upper()}, {' '.join(author_names)}"
-    for author in data.other_authors:  # type: ignore
-        author_names = author.split(" ")
-        author_str += f"; {author_names.pop().upper()}, {' '.join(author_names)}"
+    author_str = format_authors(data.main_author, data.other_authors)
 
     # basic required reference data
     title_str = f"{data.title}: {data.subtitle}" if data.subtitle else data.title
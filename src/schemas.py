@@ -4,10 +4,13 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from .names import AuthorName
+
 
 class JournalArticle(BaseModel):
-    main_author: str
-    other_authors: Optional[list[str]] = []
+    # structured sources (e.g. Crossref) give pre-split names, free text is parsed when formatting
+    main_author: str | AuthorName
+    other_authors: Optional[list[str | AuthorName]] = []
 
     title: str
     subtitle: Optional[str] = None
@@ -28,8 +31,8 @@ class JournalArticle(BaseModel):
 
 
 class ProceedingsArticle(BaseModel):
-    main_author: str
-    other_authors: Optional[list[str]] = []
+    main_author: str | AuthorName
+    other_authors: Optional[list[str | AuthorName]] = []
 
     title: str
     subtitle: Optional[str] = None
@@ -8,6 +8,7 @@ import re
 import aiohttp
 
 from .schemas import JournalArticle, ProceedingsArticle, Monograph
+from .names import compose_author_name
 
 
 class CrossrefTypes(Enum):
@@ -33,9 +34,7 @@ class CrossrefService:
             if author.get("name"):
                 continue
 
-            author_name = f'{author.get("given")} ' if author.get("given") else ""
-            author_name += f'{author.get("family")} ' if author.get("family") else ""
-            author_name = author_name.strip()
+            author_name = compose_author_name(author.get("family"), author.get("given"), author.get("suffix"))
 
             if author.get("sequence") == "first":
                 main_author = author_name
@@ -157,9 +156,7 @@ class CrossrefService:
             if author.get("name"):
                 continue
 
-            author_name = f'{author.get("given")} ' if author.get("given") else ""
-            author_name += f'{author.get("family")} ' if author.get("family") else ""
-            author_name = author_name.strip()
+            author_name = compose_author_name(author.get("family"), author.get("given"), author.get("suffix"))
 
             if author.get("sequence") == "first":
                 main_author = author_name